@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import threading
 from enum import Enum
 
@@ -15,6 +16,11 @@ from vox.stt import create_stt_engine
 
 logger = logging.getLogger(__name__)
 
+# Fillers that still need LLM cleanup even in short utterances.
+# Longest first so the alternation reports the full filler.
+_FILLERS: tuple[str, ...] = ("えーと", "えっと", "あのー", "うーん", "えー", "まあ")
+_FILLER_RE = re.compile("|".join(map(re.escape, _FILLERS)))
+
 
 class AppState(str, Enum):
     IDLE = "idle"
@@ -43,9 +49,11 @@ class VoxApp:
         self._pipeline = PipelineRunner(
             recorder=self._recorder,
             stt=self._stt,
-            llm=self._llm,
+            llm=self._llm if config.llm.enabled else None,
             inserter=self._inserter,
             sample_rate=config.audio.sample_rate,
+            skip_llm=self._should_skip_llm,
+            min_duration_sec=config.audio.min_duration_sec,
         )
         self._hotkey = HotkeyListener(
             config.hotkey,
@@ -67,6 +75,8 @@ class VoxApp:
         vram = self._stt.get_vram_usage_mb()
         logger.info("STT model loaded (VRAM: ~%dMB)", vram)
 
+        if self._config.llm.enabled:
+            self._llm.start_keepalive()
         self._hotkey.start()
         with self._lock:
             if self._state == AppState.STOPPED:
@@ -85,6 +95,7 @@ class VoxApp:
 
         self._hotkey.set_enabled(False)
         self._hotkey.stop()
+        self._llm.stop_keepalive()
 
         if prev_state == AppState.RECORDING:
             # Best-effort cleanup for an active audio stream.
@@ -99,6 +110,15 @@ class VoxApp:
             self._state = AppState.STOPPED
         logger.info("=== Vox stopped ===")
 
+    def _should_skip_llm(self, text: str) -> bool:
+        """Short utterances without fillers are inserted as-is, saving an LLM round trip."""
+        llm_config = self._config.llm
+        return (
+            llm_config.skip_short
+            and len(text) <= llm_config.skip_short_max_chars
+            and _FILLER_RE.search(text) is None
+        )
+
     def _on_key_press(self) -> None:
         with self._lock:
             if self._state != AppState.IDLE:
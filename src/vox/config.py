@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, NamedTuple
 
 import yaml
 from pydantic import BaseModel, Field
 
+try:
+    # LibYAML C binding (bundled in PyYAML wheels); much faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class VADConfig(BaseModel):
     min_speech_duration_ms: int = Field(default=250, gt=0)
@@ -15,10 +22,21 @@ class VADConfig(BaseModel):
 
 
 class FasterWhisperConfig(BaseModel):
-    model: str = "large-v3-turbo"
+    model: str = "large-v3-turbo"  # or "distil-large-v3"
     device: str = "cuda"
-    compute_type: str = "float16"
+    compute_type: str | None = None  # None: "int8_float16" on CUDA, "int8" on CPU
     language: str = "ja"
+    beam_size: int = Field(default=5, gt=0)
+    condition_on_previous_text: bool = False
+    no_speech_threshold: float = Field(default=0.6, ge=0.0, le=1.0)
+    log_prob_threshold: float = -0.5
+    compression_ratio_threshold: float = Field(default=2.0, gt=0)
+    hallucination_silence_threshold: float | None = Field(default=2.0, gt=0)
+    initial_prompt: str | None = None
+    hotwords: str | None = None
+    repetition_penalty: float = Field(default=1.0, gt=0)
+    patience: float = Field(default=1.0, gt=0)
+    vad_filter: bool = True
     vad: VADConfig = Field(default_factory=VADConfig)
 
 
@@ -35,6 +53,7 @@ class STTConfig(BaseModel):
 
 
 class LLMConfig(BaseModel):
+    enabled: bool = False
     backend: str = "ollama"
     model: str = "qwen2.5:7b-instruct-q4_K_M"
     base_url: str = "http://localhost:11434/v1"
@@ -43,6 +62,12 @@ class LLMConfig(BaseModel):
     request_timeout_sec: float = Field(default=20.0, gt=0)
     retry_count: int = Field(default=2, ge=0, le=10)
     retry_backoff_sec: float = Field(default=0.3, ge=0.0)
+    cache_prompt: bool = True
+    response_cache_size: int = Field(default=128, ge=0)
+    keep_alive_sec: int = Field(default=1800, ge=0)
+    skip_short: bool = True
+    skip_short_max_chars: int = Field(default=20, ge=0)
+    output_format: Literal["single_line", "multi_line"] = "single_line"
 
 
 class HotkeyConfig(BaseModel):
@@ -53,6 +78,7 @@ class AudioConfig(BaseModel):
     sample_rate: int = Field(default=16000, gt=0)
     channels: int = Field(default=1, gt=0)
     max_duration_sec: int = Field(default=60, gt=0)
+    min_duration_sec: float = Field(default=0.5, ge=0.0)
 
 
 class InsertionConfig(BaseModel):
@@ -68,17 +94,8 @@ class AppConfig(BaseModel):
     insertion: InsertionConfig = Field(default_factory=InsertionConfig)
 
 
-def load_config(path: Path | None = None) -> AppConfig:
-    """Load configuration from YAML file. Falls back to defaults if file not found."""
-    if path is None:
-        path = Path("config.yaml")
-
-    if not path.exists():
-        return AppConfig()
-
-    with path.open(encoding="utf-8") as f:
-        loaded = yaml.safe_load(f)
-
+def _from_mapping(loaded: Any) -> AppConfig:
+    """Validate a parsed YAML document (None for an empty file) into an AppConfig."""
     if loaded is None:
         data: dict[str, Any] = {}
     elif isinstance(loaded, dict):
@@ -86,4 +103,52 @@ def load_config(path: Path | None = None) -> AppConfig:
     else:
         raise ValueError("Config file must contain a YAML mapping at the root")
 
-    return AppConfig(**data)
+    return AppConfig(**data)
+
+
+class _CachedConfig(NamedTuple):
+    signature: tuple[int, int]  # (st_mtime_ns, st_size)
+    digest: bytes  # blake2b of the raw file contents
+    config: AppConfig
+
+
+# Parsed configs keyed by resolved path. A changed stat signature triggers a
+# re-read, but parsing and validation are skipped if the contents hash the
+# same (file touched or re-saved without edits).
+_CONFIG_CACHE: dict[str, _CachedConfig] = {}
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configurations."""
+    _CONFIG_CACHE.clear()
+
+
+def load_config(path: Path | None = None) -> AppConfig:
+    """Load configuration from YAML file. Falls back to defaults if file not found.
+
+    Results are cached per file until its contents change. Each call returns
+    a fresh copy, so callers may mutate the result freely.
+    """
+    if path is None:
+        path = Path("config.yaml")
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return AppConfig()
+
+    key = str(path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached.signature == signature:
+        return cached.config.model_copy(deep=True)
+
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    if cached is not None and cached.digest == digest:
+        _CONFIG_CACHE[key] = cached._replace(signature=signature)
+        return cached.config.model_copy(deep=True)
+
+    config = _from_mapping(yaml.load(raw.decode("utf-8"), Loader=_YamlLoader))
+    _CONFIG_CACHE[key] = _CachedConfig(signature, digest, config)
+    return config.model_copy(deep=True)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from pynput import keyboard
@@ -14,19 +15,19 @@ from vox.config import HotkeyConfig
 logger = logging.getLogger(__name__)
 
 # Mapping of config key names to pynput Key objects
-_KEY_MAP: dict[str, keyboard.Key] = {
+_KEY_MAP: Mapping[str, keyboard.Key] = MappingProxyType({
     "alt_r": keyboard.Key.alt_r,
     "alt_gr": keyboard.Key.alt_gr,
     "alt_l": keyboard.Key.alt_l,
     "ctrl_r": keyboard.Key.ctrl_r,
     "ctrl_l": keyboard.Key.ctrl_l,
-}
+})
 
 # On Windows, many keyboards report right Alt as alt_gr instead of alt_r.
-# Build a set of keys to accept for each config value.
-_KEY_ALIASES: dict[str, set[keyboard.Key]] = {
-    "alt_r": {keyboard.Key.alt_r, keyboard.Key.alt_gr},
-}
+# Set of keys to accept for each config value, shared by all listeners.
+_KEY_ALIASES: Mapping[str, frozenset[keyboard.Key]] = MappingProxyType({
+    "alt_r": frozenset({keyboard.Key.alt_r, keyboard.Key.alt_gr}),
+})
 
 
 class HotkeyListener:
@@ -42,7 +43,9 @@ class HotkeyListener:
         if self._trigger_key is None:
             supported = list(_KEY_MAP)
             raise ValueError(f"Unknown trigger key: {config.trigger_key}. Supported: {supported}")
-        self._trigger_keys = _KEY_ALIASES.get(config.trigger_key, {self._trigger_key})
+        self._trigger_keys = _KEY_ALIASES.get(config.trigger_key) or frozenset(
+            {self._trigger_key}
+        )
         self._on_press = on_press
         self._on_release = on_release
         self._listener: keyboard.Listener | None = None
@@ -74,7 +77,9 @@ class HotkeyListener:
             logger.info("Hotkey listener stopped")
 
     def _handle_press(self, key: Any) -> None:
-        if key not in self._trigger_keys:
+        # Holding the key makes the OS auto-repeat press events; drop those
+        # without touching the lock. The locked check below stays authoritative.
+        if key not in self._trigger_keys or self._is_pressed:
             return
         with self._lock:
             if not self._enabled or self._is_pressed:
@@ -3,15 +3,33 @@
 from __future__ import annotations
 
 import logging
+import re
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Callable
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
+from openai.types.chat import ChatCompletionMessageParam
 
 from vox.config import LLMConfig
 
 logger = logging.getLogger(__name__)
 
+# Keep the connection to the local LLM server open between utterances.
+# httpx's default 5s keep-alive expiry would force a new TCP connection for
+# almost every dictation, since users rarely speak more often than that.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300.0)
+
+# Any whitespace run (including newlines) collapses to one space in single_line mode
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Requests through the OpenAI-compatible endpoint carry no keep_alive, so after
+# each one Ollama unloads the model on its default timer (OLLAMA_KEEP_ALIVE,
+# 5 minutes unless changed).
+_OLLAMA_DEFAULT_KEEP_ALIVE_SEC = 300
+
 SYSTEM_PROMPT = """\
 あなたは音声認識テキストを整形するアシスタントです。
 入力されたテキストを以下のルールに従って整形し、整形後のテキストのみを出力してください。
@@ -39,6 +57,47 @@ class LLMPermanentError(LLMError):
     """Non-retryable LLM error."""
 
 
+# Clients by base_url, shared across LLMFormatter instances so a config reload
+# keeps the existing connection pool instead of opening a new one.
+_CLIENT_CACHE: dict[str, OpenAI] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_client(config: LLMConfig) -> OpenAI:
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(config.base_url)
+        if client is None:
+            client = OpenAI(
+                base_url=config.base_url,
+                api_key="not-needed",  # Local LLM doesn't require API key
+                http_client=DefaultHttpxClient(limits=_HTTP_LIMITS),
+            )
+            _CLIENT_CACHE[config.base_url] = client
+        return client
+
+
+# Plain httpx client for Ollama's native API (warmup), pooled like the OpenAI
+# clients so each keep-alive tick reuses the same connection.
+_NATIVE_CLIENT: httpx.Client | None = None
+
+
+def _get_native_client() -> httpx.Client:
+    global _NATIVE_CLIENT
+    with _CLIENT_CACHE_LOCK:
+        if _NATIVE_CLIENT is None:
+            _NATIVE_CLIENT = httpx.Client(limits=_HTTP_LIMITS)
+        return _NATIVE_CLIENT
+
+
+def _max_output_chars(raw_text: str) -> int:
+    """Longest output accepted as a reformatting of raw_text.
+
+    Formatting only removes fillers and adds punctuation, so an output several
+    times longer than the input means the model answered or elaborated instead.
+    """
+    return max(3 * len(raw_text), len(raw_text) + 40)
+
+
 def _is_transient_error(error: Exception) -> bool:
     name = error.__class__.__name__.lower()
     return any(token in name for token in ("timeout", "connection", "rate"))
@@ -54,11 +113,83 @@ class LLMFormatter:
         sleep_fn: Callable[[float], None] = time.sleep,
     ) -> None:
         self._config = config
-        self._client = client or OpenAI(
-            base_url=config.base_url,
-            api_key="not-needed",  # Local LLM doesn't require API key
-        )
+        self._client = client or _get_client(config)
         self._sleep = sleep_fn
+        # Static prompt prefix, shared by every request. Keeping it byte-identical
+        # lets servers with prompt caching reuse its KV cache across requests.
+        self._base_messages: tuple[ChatCompletionMessageParam, ...] = (
+            {"role": "system", "content": SYSTEM_PROMPT},
+        )
+        # LRU of stripped input -> formatted output; dictation repeats short phrases
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._extra_body: dict[str, Any] = {}
+        if config.cache_prompt:
+            # llama.cpp-style servers; others ignore unknown request fields
+            self._extra_body["cache_prompt"] = True
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread: threading.Thread | None = None
+
+    def warmup(self) -> bool:
+        """Load the model on the Ollama server and keep it for keep_alive_sec.
+
+        Uses Ollama's native /api/generate: the OpenAI-compatible endpoint has
+        no keep_alive setting. A generate request without a prompt only loads
+        the model.
+
+        Returns:
+            True if the request succeeded. Failures are logged, never raised.
+        """
+        api_root = self._config.base_url.rstrip("/").removesuffix("/v1")
+        try:
+            response = _get_native_client().post(
+                f"{api_root}/api/generate",
+                json={"model": self._config.model, "keep_alive": f"{self._config.keep_alive_sec}s"},
+                timeout=self._config.request_timeout_sec,
+            )
+            response.raise_for_status()
+        except Exception as err:  # noqa: BLE001
+            logger.warning("LLM warmup failed: %s", err)
+            return False
+        logger.debug("LLM warmup done")
+        return True
+
+    def start_keepalive(self) -> None:
+        """Warm the model now and re-warm it before the server's idle unload.
+
+        Runs in a daemon thread; no-op unless the backend is Ollama with a
+        non-zero keep_alive_sec, or if already running.
+        """
+        if (
+            self._config.backend != "ollama"
+            or self._config.keep_alive_sec == 0
+            or self._keepalive_thread is not None
+        ):
+            return
+        self._keepalive_stop.clear()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, name="vox-llm-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def stop_keepalive(self) -> None:
+        """Stop the keep-alive thread. Safe to call multiple times."""
+        thread = self._keepalive_thread
+        if thread is None:
+            return
+        self._keepalive_stop.set()
+        thread.join(timeout=self._config.request_timeout_sec)
+        self._keepalive_thread = None
+
+    def _keepalive_loop(self) -> None:
+        # Every formatting request resets the unload timer to the server
+        # default, so re-warm well within whichever timer is shorter.
+        ttl = min(self._config.keep_alive_sec, _OLLAMA_DEFAULT_KEEP_ALIVE_SEC)
+        interval = ttl / 2
+        while True:
+            self.warmup()
+            if self._keepalive_stop.wait(interval):
+                return
 
     def format_text(self, raw_text: str) -> str:
         """Send raw STT text to LLM for formatting.
@@ -73,26 +204,108 @@ class LLMFormatter:
             LLMTransientError: Temporary LLM failure after retries.
             LLMPermanentError: Non-retryable LLM failure.
         """
-        if not raw_text.strip():
+        text = raw_text.strip()
+        if not text:
             return ""
 
-        logger.info("LLM formatting: input=%d chars", len(raw_text))
+        cached = self._cache_get(text)
+        if cached is not None:
+            logger.info("LLM formatting: cache hit (%d chars)", len(text))
+            return cached
+
+        result = self._request_format(text)
+        if result is None:
+            # Rejected output: fall back to the raw text, but ask again next time
+            return text
+        if result:
+            self._cache_put(text, result)
+        return result
+
+    def _cache_get(self, text: str) -> str | None:
+        with self._cache_lock:
+            result = self._response_cache.get(text)
+            if result is not None:
+                self._response_cache.move_to_end(text)
+            return result
+
+    def _cache_put(self, text: str, result: str) -> None:
+        max_size = self._config.response_cache_size
+        if max_size == 0:
+            return
+        with self._cache_lock:
+            self._response_cache[text] = result
+            self._response_cache.move_to_end(text)
+            while len(self._response_cache) > max_size:
+                self._response_cache.popitem(last=False)
+
+    def _request_format(self, text: str) -> str | None:
+        """Run one formatting request with retries (no caching).
+
+        Returns:
+            The formatted text, or None if the output was rejected as a runaway
+            answer rather than a reformatting.
+        """
+        logger.info("LLM formatting: input=%d chars", len(text))
+        messages: list[ChatCompletionMessageParam] = [
+            *self._base_messages,
+            {"role": "user", "content": text},
+        ]
+        # Formatting never needs much more than the input, so bound decode time
+        # when the model starts answering instead of formatting.
+        max_tokens = min(self._config.max_tokens, 2 * len(text) + 32)
+        max_chars = _max_output_chars(text)
         max_attempts = self._config.retry_count + 1
 
         for attempt in range(1, max_attempts + 1):
             try:
                 response = self._client.chat.completions.create(
                     model=self._config.model,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": raw_text},
-                    ],
+                    messages=messages,
                     temperature=self._config.temperature,
-                    max_tokens=self._config.max_tokens,
+                    max_tokens=max_tokens,
                     timeout=self._config.request_timeout_sec,
+                    extra_body=self._extra_body or None,
+                    stream=True,
                 )
 
-                result = (response.choices[0].message.content or "").strip()
+                # Stream so a runaway answer is cut off as soon as it exceeds
+                # what a reformatting could produce, instead of fully decoded.
+                # Leaving the block closes the HTTP response on every path,
+                # including errors mid-stream before a retry opens another.
+                parts: list[str] = []
+                received = 0
+                finish_reason = None
+                with response:
+                    for chunk in response:
+                        if not chunk.choices:
+                            continue
+                        choice = chunk.choices[0]
+                        finish_reason = choice.finish_reason or finish_reason
+                        delta = choice.delta.content
+                        if not delta:
+                            continue
+                        parts.append(delta)
+                        received += len(delta)
+                        if received > max_chars:
+                            logger.warning(
+                                "LLM output too long (>%d chars), using raw text: %s",
+                                max_chars,
+                                "".join(parts),
+                            )
+                            return None
+
+                if finish_reason == "length":
+                    # Cut off at max_tokens: a partial answer, not a formatted text
+                    logger.warning(
+                        "LLM output truncated at max_tokens=%d, using raw text: %s",
+                        max_tokens,
+                        "".join(parts),
+                    )
+                    return None
+
+                result = "".join(parts).strip()
+                if self._config.output_format == "single_line":
+                    result = _WHITESPACE_RE.sub(" ", result)
                 logger.info("LLM formatting: output=%d chars", len(result))
                 return result
             except Exception as err:  # noqa: BLE001
@@ -118,4 +331,4 @@ class LLMFormatter:
                 logger.error("LLM permanent error: %s", err)
                 raise LLMPermanentError("LLM request failed") from err
 
-        raise LLMTransientError("LLM request failed after retries")
+        raise LLMTransientError("LLM request failed after retries")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Protocol
 
 import numpy as np
@@ -33,15 +34,19 @@ class PipelineRunner:
         self,
         recorder: RecorderProtocol,
         stt: STTProtocol,
-        llm: LLMProtocol,
+        llm: LLMProtocol | None,
         inserter: InserterProtocol,
         sample_rate: int,
+        skip_llm: Callable[[str], bool] | None = None,
+        min_duration_sec: float = 0.0,
     ) -> None:
         self._recorder = recorder
         self._stt = stt
         self._llm = llm
         self._inserter = inserter
         self._sample_rate = sample_rate
+        self._skip_llm = skip_llm
+        self._min_duration_sec = min_duration_sec
 
     def run_once(self) -> bool:
         """Execute one full pipeline run.
@@ -56,6 +61,9 @@ class PipelineRunner:
 
         duration = len(audio) / self._sample_rate
         logger.info("[Pipeline] Audio: %.1fs, %d samples", duration, len(audio))
+        if duration < self._min_duration_sec:
+            logger.info("[Pipeline] Audio shorter than %.1fs, skipping", self._min_duration_sec)
+            return False
 
         logger.info("[Pipeline] Running STT...")
         raw_text = self._stt.transcribe(audio, self._sample_rate)
@@ -64,8 +72,15 @@ class PipelineRunner:
             return False
         logger.info("[Pipeline] STT result: %s", raw_text)
 
-        logger.info("[Pipeline] Running LLM formatting...")
-        formatted_text = self._llm.format_text(raw_text)
+        if self._llm is None:
+            logger.info("[Pipeline] LLM disabled, inserting STT text as-is")
+            formatted_text = raw_text.strip()
+        elif self._skip_llm is not None and self._skip_llm(raw_text):
+            logger.info("[Pipeline] Short text without fillers, skipping LLM")
+            formatted_text = raw_text.strip()
+        else:
+            logger.info("[Pipeline] Running LLM formatting...")
+            formatted_text = self._llm.format_text(raw_text)
         if not formatted_text.strip():
             logger.info("[Pipeline] LLM returned empty text, skipping")
             return False
@@ -74,4 +89,4 @@ class PipelineRunner:
         logger.info("[Pipeline] Inserting text...")
         self._inserter.insert(formatted_text)
         logger.info("[Pipeline] Done")
-        return True
+        return True
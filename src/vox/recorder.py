@@ -40,20 +40,21 @@ class AudioRecorder:
         stream_factory: StreamFactory | None = None,
     ) -> None:
         self._config = config
-        self._frames: list[np.ndarray] = []
         self._frame_count = 0
         self._is_recording = False
         self._stream: Any | None = None
         self._stream_factory = stream_factory or _default_stream_factory
         self._lock = threading.Lock()
         self._max_frames = config.sample_rate * config.max_duration_sec
+        # One buffer for the longest allowed recording, reused across sessions.
+        # np.empty leaves pages untouched until the callback writes them.
+        self._buffer = np.empty((self._max_frames, config.channels), dtype=np.float32)
 
     def start(self) -> None:
         """Start recording audio."""
         with self._lock:
             if self._is_recording:
                 return
-            self._frames = []
             self._frame_count = 0
 
         rate = self._config.sample_rate
@@ -88,11 +89,12 @@ class AudioRecorder:
             except Exception:
                 logger.exception("Error closing audio stream")
 
-        if not self._frames:
+        if self._frame_count == 0:
             logger.warning("No audio frames recorded")
             return np.array([], dtype=np.float32)
 
-        audio = np.concatenate(self._frames, axis=0).flatten()
+        # flatten() copies, so the next session can reuse the buffer
+        audio = self._buffer[: self._frame_count].flatten()
         duration = len(audio) / self._config.sample_rate
         logger.info("Recording stopped: %.1fs, %d samples", duration, len(audio))
         return audio
@@ -110,10 +112,12 @@ class AudioRecorder:
         with self._lock:
             if not self._is_recording:
                 return
-            if self._frame_count >= self._max_frames:
+            start = self._frame_count
+            if start >= self._max_frames:
                 self._is_recording = False
                 max_s = self._config.max_duration_sec
                 logger.warning("Max recording duration reached (%ds)", max_s)
                 return
-            self._frames.append(indata.copy())
-            self._frame_count += len(indata)
+            count = min(len(indata), self._max_frames - start)
+            self._buffer[start : start + count] = indata[:count]
+            self._frame_count = start + count
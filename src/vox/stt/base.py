@@ -10,6 +10,9 @@ import numpy as np
 class STTEngine(ABC):
     """Abstract base class for Speech-to-Text engines."""
 
+    # No instance state here, so subclasses may use __slots__ without a __dict__
+    __slots__ = ()
+
     @abstractmethod
     def load_model(self) -> None:
         """Load the model into GPU memory."""
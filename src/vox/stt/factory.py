@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from vox.config import STTConfig
 from vox.stt.base import STTEngine
 
 
+def _create_faster_whisper(config: STTConfig) -> STTEngine:
+    # Delayed import keeps faster-whisper out of module import for other engines.
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    return FasterWhisperEngine(config.faster_whisper)
+
+
+_ENGINES: dict[str, Callable[[STTConfig], STTEngine]] = {
+    "faster-whisper": _create_faster_whisper,
+}
+
+# Accepted in config but not implemented yet (SenseVoice is planned for Phase 2).
+_NOT_IMPLEMENTED: frozenset[str] = frozenset({"sensevoice"})
+
+
 def create_stt_engine(config: STTConfig) -> STTEngine:
     """Create an STT engine based on configuration."""
-    if config.engine == "faster-whisper":
-        from vox.stt.faster_whisper_engine import FasterWhisperEngine
-
-        return FasterWhisperEngine(config.faster_whisper)
-    elif config.engine == "sensevoice":
+    create = _ENGINES.get(config.engine)
+    if create is not None:
+        return create(config)
+    if config.engine in _NOT_IMPLEMENTED:
         raise NotImplementedError("SenseVoice engine will be implemented in Phase 2")
-    else:
-        raise ValueError(f"Unknown STT engine: {config.engine}")
+    raise ValueError(f"Unknown STT engine: {config.engine}")
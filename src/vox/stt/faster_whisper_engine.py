@@ -4,36 +4,33 @@ from __future__ import annotations
 
 import logging
 import re
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from faster_whisper import WhisperModel
 
 from vox.config import FasterWhisperConfig
 from vox.stt.base import STTEngine
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 logger = logging.getLogger(__name__)
 
-# Known hallucination patterns (YouTube outros, repeated phrases, etc.)
-_HALLUCINATION_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(p)
-    for p in [
-        r"ご視聴ありがとうございました",
-        r"チャンネル登録",
-        r"高評価",
-        r"ご清聴ありがとうございました",
-        r"字幕",
-        r"次の動画",
-        r"ご覧いただき",
-        r"最後までご覧",
-    ]
-]
-
-# Repetition pattern: same phrase repeated 3+ times
-_REPETITION_RE = re.compile(r"(.{2,}?)\1{2,}")
+# Known hallucination phrases (YouTube outros, subtitle credits, etc.)
+_HALLUCINATION_PHRASES: tuple[str, ...] = (
+    "ご視聴ありがとうございました",
+    "チャンネル登録",
+    "高評価",
+    "ご清聴ありがとうございました",
+    "字幕",
+    "次の動画",
+    "ご覧いただき",
+    "最後までご覧",
+)
 
 # Simplified Chinese characters NOT used in Japanese.
 # Excludes chars shared with Japanese: 着会没当与云参双号叶国据担机条灯点礼随
-_SIMPLIFIED_CHINESE_CHARS = set(
+_SIMPLIFIED_CHINESE_CHARS = frozenset(
     "这们对进过还该让从虽认谢说请问关开连运远选边达总办图书样东两为"
     "时应发业动产专乐义习乡亲买亚仅价传伟伤众优华单卖卫厂变"
     "响员团园围坏块处备复够头夺奖导层币师帮广庆归录忆态怀护报拥择"
@@ -43,6 +40,37 @@ _SIMPLIFIED_CHINESE_CHARS = set(
     "错键阅队阳阶险际隐难预领频风飞饭馆验鱼鸡龙"
 )
 
+_PHRASE_ALTERNATIVES = (
+    "(?P<cn>[" + "".join(sorted(_SIMPLIFIED_CHINESE_CHARS)) + "])"
+    "|(?P<hall>" + "|".join(map(re.escape, _HALLUCINATION_PHRASES)) + ")"
+)
+
+# Simplified Chinese, hallucination phrases and repetition (same phrase 3+
+# times) fused into one alternation so a transcript is scanned once; the
+# matching group name tells which check fired. The repeated unit is group 4
+# and is unbounded: Whisper typically loops whole sentences.
+_VALIDATOR_RE = re.compile(_PHRASE_ALTERNATIVES + r"|(?P<rep>(.{2,}?)\4{2,})")
+
+# Shortest text the repetition branch can match (a 2-char unit three times).
+# Below it the backreference search is skipped; results are unchanged.
+_MIN_REPETITION_LEN = 6
+_PHRASE_RE = re.compile(_PHRASE_ALTERNATIVES)
+
+# Measured float16 footprints. CTranslate2 allocates outside any
+# Python-visible allocator, so other precisions are scaled from these.
+_FP16_VRAM_MB = 4000  # large-v3-turbo
+_DISTIL_FP16_VRAM_MB = 1500  # distil-* (2 decoder layers)
+
+# int8 weights with float16 activations keep large-v3-turbo accuracy on GPU
+# at roughly half the float16 footprint; CPUs have no fast float16 path.
+_DEFAULT_COMPUTE_TYPES = {"cuda": "int8_float16", "cpu": "int8"}
+
+_VALIDATOR_MESSAGES = {
+    "cn": "Simplified Chinese detected, discarding: %s",
+    "hall": "Hallucination pattern detected, discarding: %s",
+    "rep": "Repetition detected, discarding: %s",
+}
+
 
 class FasterWhisperEngine(STTEngine):
     """STT engine using faster-whisper (CTranslate2)."""
@@ -50,21 +78,45 @@ class FasterWhisperEngine(STTEngine):
     def __init__(self, config: FasterWhisperConfig) -> None:
         self._config = config
         self._model: WhisperModel | None = None
+        self._compute_type = config.compute_type or _DEFAULT_COMPUTE_TYPES.get(
+            config.device, "default"
+        )
+        self._transcribe_kwargs = self._build_transcribe_kwargs(config)
 
     def load_model(self) -> None:
+        # Delayed import: CTranslate2/ONNX native libraries are only loaded
+        # when a model is actually needed, not on module import.
+        from faster_whisper import WhisperModel
+
         logger.info(
             "Loading faster-whisper model: %s (device=%s, compute=%s)",
             self._config.model,
             self._config.device,
-            self._config.compute_type,
+            self._compute_type,
         )
         self._model = WhisperModel(
             self._config.model,
             device=self._config.device,
-            compute_type=self._config.compute_type,
+            compute_type=self._compute_type,
         )
+        if self._config.vad_filter:
+            self._preload_vad_model()
         logger.info("faster-whisper model loaded successfully")
 
+    @staticmethod
+    def _preload_vad_model() -> None:
+        """Create the Silero VAD ONNX session now instead of on the first utterance.
+
+        faster-whisper caches the session per process (lru_cache), so this only
+        moves the one-off initialization cost into startup.
+        """
+        try:
+            from faster_whisper.vad import get_vad_model
+        except ImportError:
+            logger.debug("faster_whisper.vad.get_vad_model unavailable, skipping VAD preload")
+            return
+        get_vad_model()
+
     def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
         if self._model is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
@@ -74,46 +126,56 @@ class FasterWhisperEngine(STTEngine):
 
         duration = len(audio) / sample_rate
 
-        segments, info = self._model.transcribe(
-            audio,
-            language=self._config.language,
-            beam_size=self._config.beam_size,
-            condition_on_previous_text=self._config.condition_on_previous_text,
-            no_speech_threshold=self._config.no_speech_threshold,
-            log_prob_threshold=self._config.log_prob_threshold,
-            compression_ratio_threshold=self._config.compression_ratio_threshold,
-            hallucination_silence_threshold=self._config.hallucination_silence_threshold,
-            word_timestamps=self._config.hallucination_silence_threshold is not None,
-            initial_prompt=self._config.initial_prompt,
-            hotwords=self._config.hotwords,
-            repetition_penalty=self._config.repetition_penalty,
-            patience=self._config.patience,
-            vad_filter=True,
-            vad_parameters={
-                "min_speech_duration_ms": self._config.vad.min_speech_duration_ms,
-                "min_silence_duration_ms": self._config.vad.min_silence_duration_ms,
-            },
-        )
+        segments, info = self._model.transcribe(audio, **self._transcribe_kwargs)
 
-        text = "".join(segment.text for segment in segments).strip()
+        # A list lets str.join size the result in one pass instead of growing it.
+        text = "".join([segment.text for segment in segments]).strip()
         prob = info.language_probability
         logger.info("STT result (lang=%s, prob=%.2f): %s", info.language, prob, text)
 
         text = self._validate_transcription(text, duration)
         return text
 
+    @staticmethod
+    def _build_transcribe_kwargs(config: FasterWhisperConfig) -> dict[str, Any]:
+        """Build transcribe() kwargs once, omitting no-op options.
+
+        An empty prompt or hotword string still runs prompt tokenization and
+        lengthens the decoder prefix, and penalty/patience of 1.0 are the
+        library defaults, so they are only forwarded when they change decoding.
+        """
+        kwargs: dict[str, Any] = {
+            "language": config.language,
+            "beam_size": config.beam_size,
+            "condition_on_previous_text": config.condition_on_previous_text,
+            "no_speech_threshold": config.no_speech_threshold,
+            "log_prob_threshold": config.log_prob_threshold,
+            "compression_ratio_threshold": config.compression_ratio_threshold,
+            "hallucination_silence_threshold": config.hallucination_silence_threshold,
+            "word_timestamps": config.hallucination_silence_threshold is not None,
+            "vad_filter": config.vad_filter,
+        }
+        if config.vad_filter:
+            # Silero drops pauses before decoding, so silence never reaches the decoder
+            kwargs["vad_parameters"] = {
+                "min_speech_duration_ms": config.vad.min_speech_duration_ms,
+                "min_silence_duration_ms": config.vad.min_silence_duration_ms,
+            }
+        if config.initial_prompt:
+            kwargs["initial_prompt"] = config.initial_prompt
+        if config.hotwords:
+            kwargs["hotwords"] = config.hotwords
+        if config.repetition_penalty != 1.0:
+            kwargs["repetition_penalty"] = config.repetition_penalty
+        if config.patience != 1.0:
+            kwargs["patience"] = config.patience
+        return kwargs
+
     def _validate_transcription(self, text: str, duration: float) -> str:
         """Post-process validation to filter hallucinations and Chinese output."""
         if not text:
             return ""
 
-        # Check for simplified Chinese characters
-        if self._contains_simplified_chinese(text):
-            logger.warning(
-                "Simplified Chinese detected, discarding: %s", text
-            )
-            return ""
-
         # Check character-to-duration ratio (short audio producing long text)
         if duration > 0:
             chars_per_sec = len(text) / duration
@@ -129,24 +191,36 @@ class FasterWhisperEngine(STTEngine):
                 )
                 return ""
 
-        # Check known hallucination patterns
-        for pattern in _HALLUCINATION_PATTERNS:
-            if pattern.search(text):
-                logger.warning(
-                    "Hallucination pattern detected, discarding: %s", text
-                )
-                return ""
-
-        # Check for excessive repetition
-        if _REPETITION_RE.search(text):
-            logger.warning("Repetition detected, discarding: %s", text)
+        # Simplified Chinese, known hallucination phrases, excessive repetition
+        pattern = _VALIDATOR_RE if len(text) >= _MIN_REPETITION_LEN else _PHRASE_RE
+        match = pattern.search(text)
+        if match is not None:
+            logger.warning(_VALIDATOR_MESSAGES[str(match.lastgroup)], text)
             return ""
 
         return text
 
     def _contains_simplified_chinese(self, text: str) -> bool:
-        """Check if text contains simplified Chinese characters."""
-        return any(ch in _SIMPLIFIED_CHINESE_CHARS for ch in text)
+        """Check if text contains simplified Chinese characters.
+
+        Standalone form of the cn group in _VALIDATOR_RE (same character set).
+        """
+        return not _SIMPLIFIED_CHINESE_CHARS.isdisjoint(text)
 
     def get_vram_usage_mb(self) -> int:
-        return 4000  # ~4GB for large-v3-turbo float16
+        if self._config.device == "cpu":
+            return 0
+        compute_type = self._compute_type
+        if compute_type.startswith("int8"):
+            scale = 0.5  # int8 weights halve the footprint
+        elif compute_type == "float32":
+            scale = 2.0
+        else:
+            scale = 1.0
+        base = _DISTIL_FP16_VRAM_MB if self._is_distil_model() else _FP16_VRAM_MB
+        return int(base * scale)
+
+    def _is_distil_model(self) -> bool:
+        # Accept both short names ("distil-large-v3") and HF repo ids
+        # ("distil-whisper/distil-large-v3").
+        return self._config.model.rsplit("/", 1)[-1].startswith("distil-")
@@ -0,0 +1,114 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+import vox.llm
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_client_cache():
+    # Tests patch vox.llm.OpenAI; never hand a cached client to the next test
+    vox.llm._CLIENT_CACHE.clear()
+    yield
+    vox.llm._CLIENT_CACHE.clear()
+
+
+class FakeChatStream:
+    """Iterable stand-in for a streamed chat completion response."""
+
+    def __init__(
+        self,
+        content: str,
+        chunk_size: int = 4,
+        finish_reason: str = "stop",
+        error: Exception | None = None,
+    ) -> None:
+        pieces = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+        # Like the API, the final chunk carries no text, only the finish reason
+        self.chunks = [self._chunk(piece, None) for piece in pieces]
+        self.chunks.append(self._chunk(None, finish_reason))
+        self.error = error  # raised after the first chunk, like a dropped connection
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            if self.closed:
+                return
+            self.consumed += 1
+            yield chunk
+            if self.error is not None:
+                raise self.error
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __enter__(self) -> FakeChatStream:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _chunk(content: str | None, finish_reason: str | None) -> SimpleNamespace:
+        delta = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+
+@pytest.fixture
+def chat_stream():
+    return FakeChatStream
+
+
+@dataclass
+class FakeCompletions:
+    """Records create() calls and answers with a fixed reply, an error, or a handler."""
+
+    reply: Any = None
+    error: BaseException | None = None
+    handler: Callable[..., Any] | None = None
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    def create(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        if self.handler is not None:
+            return self.handler(**kwargs)
+        return self.reply
+
+
+@dataclass
+class FakeChat:
+    completions: FakeCompletions = field(default_factory=FakeCompletions)
+
+
+@dataclass
+class FakeClient:
+    """Plain-attribute stand-in for openai.OpenAI."""
+
+    chat: FakeChat = field(default_factory=FakeChat)
+    init_kwargs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def completions(self) -> FakeCompletions:
+        return self.chat.completions
+
+
+@pytest.fixture
+def fake_openai(monkeypatch) -> FakeClient:
+    client = FakeClient()
+
+    def factory(**kwargs: Any) -> FakeClient:
+        client.init_kwargs = kwargs
+        return client
+
+    monkeypatch.setattr(vox.llm, "OpenAI", factory)
+    return client
@@ -5,6 +5,8 @@ from __future__ import annotations
 import threading
 import time
 
+import pytest
+
 from vox.app import AppState, VoxApp
 from vox.config import AppConfig
 
@@ -31,7 +33,14 @@ class FakeSTT:
 
 
 class FakeLLM:
-    pass
+    def __init__(self) -> None:
+        self.keepalive_running = False
+
+    def start_keepalive(self) -> None:
+        self.keepalive_running = True
+
+    def stop_keepalive(self) -> None:
+        self.keepalive_running = False
 
 
 class FakeInserter:
@@ -72,7 +81,7 @@ class BlockingPipeline:
         return True
 
 
-def build_app(monkeypatch, pipeline):
+def build_app(monkeypatch, pipeline, config: AppConfig | None = None):
     recorder = FakeRecorder()
     stt = FakeSTT()
     hotkey_holder: dict[str, FakeHotkey] = {}
@@ -92,10 +101,14 @@ def build_app(monkeypatch, pipeline):
     monkeypatch.setattr("vox.app.create_stt_engine", fake_create_stt_engine)
     monkeypatch.setattr("vox.app.LLMFormatter", lambda _cfg: FakeLLM())
     monkeypatch.setattr("vox.app.TextInserter", lambda _cfg: FakeInserter())
-    monkeypatch.setattr("vox.app.PipelineRunner", lambda **_kwargs: pipeline)
+    def fake_pipeline_ctor(**kwargs):
+        pipeline.kwargs = kwargs
+        return pipeline
+
+    monkeypatch.setattr("vox.app.PipelineRunner", fake_pipeline_ctor)
     monkeypatch.setattr("vox.app.HotkeyListener", fake_hotkey_ctor)
 
-    app = VoxApp(AppConfig())
+    app = VoxApp(config or AppConfig())
     return app, recorder, stt, hotkey_holder["instance"]
 
 
@@ -130,4 +143,28 @@ def test_stop_during_processing_keeps_hotkey_disabled(monkeypatch) -> None:
 
     assert not stopper.is_alive()
     assert app._state == AppState.STOPPED
-    assert hotkey.enabled_values[-1] is False
+    assert hotkey.enabled_values[-1] is False
+
+
+def test_should_skip_llm_short_text_without_fillers(monkeypatch) -> None:
+    app, _recorder, _stt, _hotkey = build_app(monkeypatch, FastPipeline())
+
+    assert app._should_skip_llm("OK") is True
+    assert app._should_skip_llm("えーとOK") is False
+    assert app._should_skip_llm("うーん、まあいいか") is False
+    assert app._should_skip_llm("これは20文字を超えるテキストです。整形が必要です。") is False
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_llm_enabled_controls_pipeline_and_keepalive(monkeypatch, enabled) -> None:
+    config = AppConfig()
+    config.llm.enabled = enabled
+    pipeline = FastPipeline()
+    app, _recorder, _stt, _hotkey = build_app(monkeypatch, pipeline, config)
+
+    assert (pipeline.kwargs["llm"] is app._llm) is enabled
+    app.start()
+
+    assert app._llm.keepalive_running is enabled
+    app.stop()
+    assert app._llm.keepalive_running is False
@@ -5,7 +5,21 @@ from pathlib import Path
 import pytest
 import yaml
 
-from vox.config import AppConfig, AudioConfig, LLMConfig, load_config
+from vox.config import (
+    AppConfig,
+    AudioConfig,
+    LLMConfig,
+    _from_mapping,
+    clear_config_cache,
+    load_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
 
 
 def test_default_config():
@@ -24,8 +38,7 @@ def test_load_config_from_yaml(tmp_path: Path):
         "llm": {"model": "qwen2.5:3b-instruct-q4_K_M"},
     }
     path = tmp_path / "config.yaml"
-    with open(path, "w") as f:
-        yaml.dump(data, f)
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
 
     config = load_config(path)
     assert config.stt.engine == "sensevoice"
@@ -55,10 +68,52 @@ def test_invalid_llm_temperature():
         LLMConfig(temperature=5.0)
 
 
-def test_load_config_invalid_root_raises(tmp_path: Path):
-    path = tmp_path / "config.yaml"
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("- invalid\n- root\n")
+def test_from_mapping_overrides_defaults():
+    config = _from_mapping({"audio": {"max_duration_sec": 30}})
+    assert config.audio.max_duration_sec == 30
+    assert config.audio.sample_rate == 16000
+
 
+def test_from_mapping_empty_document():
+    assert _from_mapping(None) == AppConfig()
+
+
+def test_from_mapping_invalid_root_raises():
     with pytest.raises(ValueError, match="YAML mapping"):
-        load_config(path)
+        _from_mapping(["invalid", "root"])
+
+
+def test_load_config_cached_until_file_changes(tmp_path: Path):
+    path = tmp_path / "config.yaml"
+    path.write_text("llm:\n  model: first\n", encoding="utf-8")
+
+    first = load_config(path)
+    second = load_config(path)
+    assert second.llm.model == "first"
+    # Callers get independent copies of the cached config
+    assert second is not first
+    first.llm.model = "mutated"
+    assert load_config(path).llm.model == "first"
+
+    path.write_text("llm:\n  model: second-model\n", encoding="utf-8")
+    assert load_config(path).llm.model == "second-model"
+
+
+def test_load_config_touched_file_skips_revalidation(tmp_path: Path, monkeypatch):
+    import os
+
+    import vox.config
+
+    path = tmp_path / "config.yaml"
+    path.write_text("llm:\n  model: first\n", encoding="utf-8")
+    assert load_config(path).llm.model == "first"
+
+    # Same contents, new mtime: served from the content-hash cache
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def fail(_loaded):
+        raise AssertionError("config should not be re-validated")
+
+    monkeypatch.setattr(vox.config, "_from_mapping", fail)
+    assert load_config(path).llm.model == "first"
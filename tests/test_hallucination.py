@@ -6,8 +6,9 @@ from vox.config import FasterWhisperConfig
 from vox.stt.faster_whisper_engine import FasterWhisperEngine
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def engine() -> FasterWhisperEngine:
+    # Validation helpers are pure, so one engine serves the whole module
     config = FasterWhisperConfig()
     return FasterWhisperEngine(config)
 
@@ -34,6 +35,21 @@ class TestValidateTranscription:
         # Same phrase repeated 3+ times
         assert engine._validate_transcription("あいうあいうあいう", 3.0) == ""
 
+    def test_repeated_sentence_detected(self, engine: FasterWhisperEngine):
+        # Whisper loops often repeat a whole sentence, not just a short phrase
+        text = "今日は良い天気なので散歩に行きましょうと言いました。" * 3
+        assert engine._validate_transcription(text, 10.0) == ""
+
+    def test_long_text_without_repetition_passes(self, engine: FasterWhisperEngine):
+        text = (
+            "本日の会議では、来期の開発計画について議論しました。"
+            "まず、音声入力機能の精度向上を最優先の課題とし、"
+            "次に設定画面の改善とドキュメントの整備を進めます。"
+            "テストの自動化についても担当者を決め、"
+            "月末までに進捗を確認することで合意しました。"
+        )
+        assert engine._validate_transcription(text, 30.0) == text
+
     def test_onegai_shimasu_not_false_positive(self, engine: FasterWhisperEngine):
         text = "しっかりと頑張るのでよろしくお願いします。"
         assert engine._validate_transcription(text, 5.0) == text
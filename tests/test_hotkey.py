@@ -85,3 +85,20 @@ def test_unknown_trigger_key_raises() -> None:
         assert "Unknown trigger key" in str(err)
     else:
         raise AssertionError("Expected ValueError")
+
+
+def test_auto_repeat_press_fires_callback_once() -> None:
+    events: list[str] = []
+    listener = HotkeyListener(
+        HotkeyConfig(trigger_key="ctrl_r"),
+        on_press=lambda: events.append("press"),
+        on_release=lambda: events.append("release"),
+    )
+    key = listener._trigger_key
+
+    for _ in range(5):
+        listener._handle_press(key)
+    listener._handle_release(key)
+    listener._handle_press(key)
+
+    assert events == ["press", "release", "press"]
@@ -1,5 +1,6 @@
 ﻿"""Tests for LLM formatter."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,94 +16,321 @@ def test_format_empty_text() -> None:
     assert formatter.format_text("   ") == ""
 
 
-@patch("vox.llm.OpenAI")
-def test_format_text_calls_api(mock_openai_cls) -> None:
-    mock_client = MagicMock()
-    mock_openai_cls.return_value = mock_client
-
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = "formatted text"
-    mock_client.chat.completions.create.return_value = mock_response
+def test_format_text_calls_api(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("formatted text")
 
     config = LLMConfig(request_timeout_sec=12.5)
     formatter = LLMFormatter(config)
     result = formatter.format_text("raw text input")
 
     assert result == "formatted text"
-    mock_client.chat.completions.create.assert_called_once()
-    call_kwargs = mock_client.chat.completions.create.call_args[1]
+    assert len(fake_openai.completions.calls) == 1
+    call_kwargs = fake_openai.completions.calls[0]
     assert call_kwargs["model"] == config.model
     assert call_kwargs["temperature"] == config.temperature
     assert call_kwargs["timeout"] == config.request_timeout_sec
+    assert call_kwargs["stream"] is True
     assert len(call_kwargs["messages"]) == 2
     assert call_kwargs["messages"][0]["content"] == SYSTEM_PROMPT
     assert call_kwargs["messages"][1]["content"] == "raw text input"
+    assert call_kwargs["extra_body"] == {"cache_prompt": True}
 
 
-def test_retries_transient_error_then_succeeds() -> None:
-    calls = {"count": 0}
-
+def test_retries_transient_error_then_succeeds(fake_openai, chat_stream) -> None:
     class DummyTimeoutError(Exception):
         pass
 
     def create(**_kwargs):
-        calls["count"] += 1
-        if calls["count"] == 1:
+        if len(fake_openai.completions.calls) == 1:
             raise DummyTimeoutError("temporary timeout")
-        response = MagicMock()
-        response.choices = [MagicMock()]
-        response.choices[0].message.content = "ok"
-        return response
+        return chat_stream("ok")
 
-    client = MagicMock()
-    client.chat.completions.create.side_effect = create
+    fake_openai.completions.handler = create
     sleeps: list[float] = []
 
     formatter = LLMFormatter(
         LLMConfig(retry_count=2, retry_backoff_sec=0.2),
-        client=client,
+        client=fake_openai,
         sleep_fn=sleeps.append,
     )
     assert formatter.format_text("hello") == "ok"
-    assert calls["count"] == 2
+    assert len(fake_openai.completions.calls) == 2
     assert sleeps == [0.2]
 
 
-def test_transient_error_exhausts_retries() -> None:
+def test_transient_error_exhausts_retries(fake_openai) -> None:
     class DummyTimeoutError(Exception):
         pass
 
-    client = MagicMock()
-    client.chat.completions.create.side_effect = DummyTimeoutError("still failing")
+    fake_openai.completions.error = DummyTimeoutError("still failing")
     sleeps: list[float] = []
 
     formatter = LLMFormatter(
         LLMConfig(retry_count=1, retry_backoff_sec=0.1),
-        client=client,
+        client=fake_openai,
         sleep_fn=sleeps.append,
     )
 
     with pytest.raises(LLMTransientError):
         formatter.format_text("hello")
 
-    assert client.chat.completions.create.call_count == 2
+    assert len(fake_openai.completions.calls) == 2
     assert sleeps == [0.1]
 
 
-def test_non_retryable_error_raises_permanent_error() -> None:
-    client = MagicMock()
-    client.chat.completions.create.side_effect = ValueError("bad request")
+def test_non_retryable_error_raises_permanent_error(fake_openai) -> None:
+    fake_openai.completions.error = ValueError("bad request")
 
-    formatter = LLMFormatter(LLMConfig(retry_count=3), client=client, sleep_fn=lambda _v: None)
+    formatter = LLMFormatter(LLMConfig(retry_count=3), client=fake_openai, sleep_fn=lambda _v: None)
 
     with pytest.raises(LLMPermanentError):
         formatter.format_text("hello")
 
-    assert client.chat.completions.create.call_count == 1
+    assert len(fake_openai.completions.calls) == 1
 
 
 def test_system_prompt_contains_rules() -> None:
     assert "フィラー" in SYSTEM_PROMPT
     assert "句読点" in SYSTEM_PROMPT
-    assert "技術用語" in SYSTEM_PROMPT
+    assert "技術用語" in SYSTEM_PROMPT
+
+
+def test_format_text_strips_input_before_sending(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("ok")
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+    formatter.format_text("  hello \n")
+
+    messages = fake_openai.completions.calls[0]["messages"]
+    assert messages[0] == {"role": "system", "content": SYSTEM_PROMPT}
+    assert messages[1] == {"role": "user", "content": "hello"}
+
+
+def test_client_keeps_connections_alive(fake_openai) -> None:
+    import httpx
+
+    LLMFormatter(LLMConfig())
+
+    assert isinstance(fake_openai.init_kwargs["http_client"], httpx.Client)
+
+
+def test_format_text_falls_back_when_output_too_long(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("これは質問への長い回答です。" * 10)
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+
+    assert formatter.format_text(" えーと天気は ") == "えーと天気は"
+
+
+def test_runaway_stream_is_closed_early(fake_openai, chat_stream) -> None:
+    stream = chat_stream("長い回答が続きます。" * 50)
+    fake_openai.completions.reply = stream
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+
+    assert formatter.format_text("短い入力") == "短い入力"
+    assert stream.closed
+    assert stream.consumed < len(stream.chunks)
+
+
+def test_stream_closed_when_interrupted_before_retry(fake_openai, chat_stream) -> None:
+    class DummyConnectionError(Exception):
+        pass
+
+    streams = [chat_stream("途中で", error=DummyConnectionError("reset")), chat_stream("ok")]
+    replies = iter(streams)
+    fake_openai.completions.handler = lambda **_kwargs: next(replies)
+
+    formatter = LLMFormatter(LLMConfig(retry_count=1), client=fake_openai, sleep_fn=lambda _v: None)
+
+    assert formatter.format_text("hello") == "ok"
+    assert all(stream.closed for stream in streams)
+
+
+def test_output_truncated_at_max_tokens_falls_back(fake_openai, chat_stream) -> None:
+    # Short enough for the character limit, but cut off by max_tokens
+    fake_openai.completions.reply = chat_stream("今日の天気は晴れで、", finish_reason="length")
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+
+    assert formatter.format_text("えーと今日の天気は晴れです") == "えーと今日の天気は晴れです"
+    formatter.format_text("えーと今日の天気は晴れです")
+    assert len(fake_openai.completions.calls) == 2
+
+
+def test_output_within_max_tokens_is_used(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("今日の天気は晴れです。", finish_reason="stop")
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+
+    assert formatter.format_text("えーと今日の天気は晴れです") == "今日の天気は晴れです。"
+
+
+def test_cache_prompt_can_be_disabled(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("ok")
+
+    formatter = LLMFormatter(LLMConfig(cache_prompt=False), client=fake_openai)
+    formatter.format_text("hello")
+
+    assert fake_openai.completions.calls[0]["extra_body"] is None
+
+
+def test_repeated_input_served_from_cache(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("了解です。")
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+
+    assert formatter.format_text("了解です") == "了解です。"
+    assert formatter.format_text(" 了解です ") == "了解です。"
+    assert len(fake_openai.completions.calls) == 1
+
+
+def test_runaway_fallback_is_not_cached(fake_openai, chat_stream) -> None:
+    replies = iter([chat_stream("これは質問への長い回答です。" * 10), chat_stream("天気は？")])
+    fake_openai.completions.handler = lambda **_kwargs: next(replies)
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+
+    assert formatter.format_text("えーと天気は") == "えーと天気は"
+    assert formatter.format_text("えーと天気は") == "天気は？"
+    assert len(fake_openai.completions.calls) == 2
+
+
+def test_empty_result_is_not_cached(fake_openai, chat_stream) -> None:
+    fake_openai.completions.handler = lambda **_kwargs: chat_stream("")
+
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+    formatter.format_text("hello")
+    formatter.format_text("hello")
+
+    assert len(fake_openai.completions.calls) == 2
+
+
+def test_response_cache_evicts_least_recently_used(fake_openai, chat_stream) -> None:
+    fake_openai.completions.handler = lambda **kwargs: chat_stream(
+        kwargs["messages"][-1]["content"]
+    )
+    formatter = LLMFormatter(LLMConfig(response_cache_size=2), client=fake_openai)
+
+    for text in ("a", "b", "a", "c", "a", "b"):
+        formatter.format_text(text)
+
+    # "b" was evicted by "c" (a was used more recently), so it is requested twice
+    sent = [call["messages"][-1]["content"] for call in fake_openai.completions.calls]
+    assert sent == ["a", "b", "c", "b"]
+
+
+def test_response_cache_disabled(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("ok")
+
+    formatter = LLMFormatter(LLMConfig(response_cache_size=0), client=fake_openai)
+    formatter.format_text("hello")
+    formatter.format_text("hello")
+
+    assert len(fake_openai.completions.calls) == 2
+
+
+@pytest.fixture
+def ollama_posts(monkeypatch) -> list[dict]:
+    """Capture warmup calls to Ollama's native API."""
+    import httpx
+
+    posts: list[dict] = []
+
+    def post(url, **kwargs):
+        posts.append({"url": url, **kwargs})
+        return httpx.Response(200, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr("vox.llm._get_native_client", lambda: SimpleNamespace(post=post))
+    return posts
+
+
+def test_warmup_loads_model_via_native_api(fake_openai, ollama_posts) -> None:
+    formatter = LLMFormatter(LLMConfig(keep_alive_sec=600), client=fake_openai)
+
+    assert formatter.warmup() is True
+    assert ollama_posts[0]["url"] == "http://localhost:11434/api/generate"
+    assert ollama_posts[0]["json"] == {"model": LLMConfig().model, "keep_alive": "600s"}
+    assert fake_openai.completions.calls == []
+
+
+def test_warmup_failure_is_not_raised(fake_openai, monkeypatch) -> None:
+    import httpx
+
+    def post(url, **_kwargs):
+        raise httpx.ConnectError("server down")
+
+    monkeypatch.setattr("vox.llm._get_native_client", lambda: SimpleNamespace(post=post))
+    formatter = LLMFormatter(LLMConfig(), client=fake_openai)
+
+    assert formatter.warmup() is False
+
+
+def test_warmup_client_is_shared() -> None:
+    import httpx
+
+    from vox.llm import _get_native_client
+
+    assert isinstance(_get_native_client(), httpx.Client)
+    assert _get_native_client() is _get_native_client()
+
+
+def test_keepalive_thread_warms_and_stops(fake_openai, ollama_posts) -> None:
+    formatter = LLMFormatter(LLMConfig(keep_alive_sec=3600), client=fake_openai)
+
+    formatter.start_keepalive()
+    formatter.stop_keepalive()
+    formatter.stop_keepalive()
+
+    assert formatter._keepalive_thread is None
+    assert len(ollama_posts) == 1
+
+
+@pytest.mark.parametrize(("keep_alive_sec", "interval"), [(3600, 150.0), (120, 60.0)])
+def test_keepalive_rewarms_within_shortest_unload_timer(
+    fake_openai, ollama_posts, keep_alive_sec, interval
+) -> None:
+    waits: list[float] = []
+    formatter = LLMFormatter(LLMConfig(keep_alive_sec=keep_alive_sec), client=fake_openai)
+    formatter._keepalive_stop.wait = lambda timeout: waits.append(timeout) or True
+
+    formatter._keepalive_loop()
+
+    # Formatting requests reset Ollama's timer to its 5-minute default
+    assert waits == [interval]
+
+
+@pytest.mark.parametrize(
+    "config", [LLMConfig(keep_alive_sec=0), LLMConfig(backend="lmstudio")]
+)
+def test_keepalive_disabled(fake_openai, ollama_posts, config) -> None:
+    formatter = LLMFormatter(config, client=fake_openai)
+
+    formatter.start_keepalive()
+
+    assert formatter._keepalive_thread is None
+    assert ollama_posts == []
+
+
+def test_max_tokens_scales_with_input_length(fake_openai, chat_stream) -> None:
+    fake_openai.completions.reply = chat_stream("ok")
+
+    formatter = LLMFormatter(LLMConfig(max_tokens=200), client=fake_openai)
+
+    formatter.format_text("あ" * 10)
+    assert fake_openai.completions.calls[-1]["max_tokens"] == 52
+    formatter.format_text("い" * 500)
+    assert fake_openai.completions.calls[-1]["max_tokens"] == 200
+
+
+@patch("vox.llm.OpenAI")
+def test_formatters_share_client_per_base_url(mock_openai_cls) -> None:
+    mock_openai_cls.side_effect = lambda **_kwargs: MagicMock()
+
+    first = LLMFormatter(LLMConfig())
+    second = LLMFormatter(LLMConfig(model="other-model"))
+    other = LLMFormatter(LLMConfig(base_url="http://localhost:1234/v1"))
+
+    assert first._client is second._client
+    assert other._client is not first._client
+    assert mock_openai_cls.call_count == 2
@@ -112,4 +112,53 @@ def test_pipeline_inserts_formatted_text() -> None:
     assert runner.run_once() is True
     assert stt.calls == 1
     assert llm.calls == 1
-    assert inserter.inserted == ["formatted"]
+    assert inserter.inserted == ["formatted"]
+
+
+def test_pipeline_skip_llm_inserts_raw_text() -> None:
+    recorder = StubRecorder(np.zeros(16000, dtype=np.float32))
+    stt = StubSTT(" OK ")
+    llm = StubLLM("formatted")
+    inserter = StubInserter()
+    runner = PipelineRunner(
+        recorder=recorder,
+        stt=stt,
+        llm=llm,
+        inserter=inserter,
+        sample_rate=16000,
+        skip_llm=lambda text: True,
+    )
+
+    assert runner.run_once() is True
+    assert llm.calls == 0
+    assert inserter.inserted == ["OK"]
+
+
+def test_pipeline_without_llm_inserts_raw_text() -> None:
+    inserter = StubInserter()
+    runner = PipelineRunner(
+        recorder=StubRecorder(np.zeros(16000, dtype=np.float32)),
+        stt=StubSTT(" えーと今日は晴れです "),
+        llm=None,
+        inserter=inserter,
+        sample_rate=16000,
+        skip_llm=lambda text: False,
+    )
+
+    assert runner.run_once() is True
+    assert inserter.inserted == ["えーと今日は晴れです"]
+
+
+def test_pipeline_skips_audio_below_min_duration() -> None:
+    stt = StubSTT("raw")
+    runner = PipelineRunner(
+        recorder=StubRecorder(np.ones(4800, dtype=np.float32)),
+        stt=stt,
+        llm=StubLLM("formatted"),
+        inserter=StubInserter(),
+        sample_rate=16000,
+        min_duration_sec=0.5,
+    )
+
+    assert runner.run_once() is False
+    assert stt.calls == 0
@@ -232,16 +232,9 @@ def test_should_skip_llm_disabled():
 # --- Output normalization tests ---
 
 
-@patch("vox.llm.OpenAI")
-def test_single_line_removes_newlines(mock_openai_cls):
+def test_single_line_removes_newlines(fake_openai, chat_stream):
     """single_line format should replace newlines with spaces."""
-    mock_client = MagicMock()
-    mock_openai_cls.return_value = mock_client
-
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = "line one\nline two\nline three"
-    mock_client.chat.completions.create.return_value = mock_response
+    fake_openai.completions.reply = chat_stream("line one\nline two\nline three")
 
     config = LLMConfig(output_format="single_line")
     formatter = LLMFormatter(config)
@@ -251,16 +244,9 @@ def test_single_line_removes_newlines(mock_openai_cls):
     assert result == "line one line two line three"
 
 
-@patch("vox.llm.OpenAI")
-def test_multi_line_preserves_newlines(mock_openai_cls):
+def test_multi_line_preserves_newlines(fake_openai, chat_stream):
     """multi_line format should preserve newlines."""
-    mock_client = MagicMock()
-    mock_openai_cls.return_value = mock_client
-
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = "line one\nline two"
-    mock_client.chat.completions.create.return_value = mock_response
+    fake_openai.completions.reply = chat_stream("line one\nline two")
 
     config = LLMConfig(output_format="multi_line")
     formatter = LLMFormatter(config)
@@ -269,16 +255,9 @@ def test_multi_line_preserves_newlines(mock_openai_cls):
     assert result == "line one\nline two"
 
 
-@patch("vox.llm.OpenAI")
-def test_single_line_collapses_multiple_spaces(mock_openai_cls):
+def test_single_line_collapses_multiple_spaces(fake_openai, chat_stream):
     """single_line should collapse multiple spaces into one."""
-    mock_client = MagicMock()
-    mock_openai_cls.return_value = mock_client
-
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = "word1\n\n\nword2"
-    mock_client.chat.completions.create.return_value = mock_response
+    fake_openai.completions.reply = chat_stream("word1\n\n\nword2")
 
     config = LLMConfig(output_format="single_line")
     formatter = LLMFormatter(config)
@@ -78,3 +78,42 @@ def test_max_duration_stops_buffer_growth() -> None:
     audio = recorder.stop()
 
     assert np.allclose(audio, np.array([1.0, 2.0], dtype=np.float32))
+
+
+def test_buffer_reused_across_sessions() -> None:
+    stream = FakeStream()
+    holder = {}
+
+    def factory(_rate, _channels, callback):
+        holder["callback"] = callback
+        return stream
+
+    recorder = AudioRecorder(AudioConfig(sample_rate=4, max_duration_sec=1), stream_factory=factory)
+
+    recorder.start()
+    holder["callback"](np.array([[1.0], [2.0], [3.0]], dtype=np.float32), 3, object(), 0)
+    first = recorder.stop()
+
+    recorder.start()
+    holder["callback"](np.array([[4.0]], dtype=np.float32), 1, object(), 0)
+    second = recorder.stop()
+
+    assert np.allclose(first, np.array([1.0, 2.0, 3.0], dtype=np.float32))
+    assert np.allclose(second, np.array([4.0], dtype=np.float32))
+
+
+def test_block_larger_than_remaining_space_is_truncated() -> None:
+    stream = FakeStream()
+    holder = {}
+
+    def factory(_rate, _channels, callback):
+        holder["callback"] = callback
+        return stream
+
+    recorder = AudioRecorder(AudioConfig(sample_rate=2, max_duration_sec=1), stream_factory=factory)
+
+    recorder.start()
+    holder["callback"](np.array([[1.0], [2.0], [3.0]], dtype=np.float32), 3, object(), 0)
+    audio = recorder.stop()
+
+    assert np.allclose(audio, np.array([1.0, 2.0], dtype=np.float32))
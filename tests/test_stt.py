@@ -9,10 +9,18 @@ from vox.config import FasterWhisperConfig, STTConfig
 from vox.stt.base import STTEngine
 from vox.stt.factory import create_stt_engine
 
+# One second of 16 kHz audio shared by every test. Only shape and dtype matter
+# (the models are mocked), so the contents are left uninitialized; read-only so
+# no test can leak an in-place change into another.
+_AUDIO_16K: np.ndarray = np.empty(16000, dtype=np.float32)
+_AUDIO_16K.setflags(write=False)
+
 
 class MockSTTEngine(STTEngine):
     """Mock STT engine for testing the interface."""
 
+    __slots__ = ("_loaded",)
+
     def __init__(self) -> None:
         self._loaded = False
 
@@ -28,34 +36,56 @@ class MockSTTEngine(STTEngine):
         return 100
 
 
-def test_mock_engine_interface():
+@pytest.fixture(scope="module")
+def loaded_mock() -> MockSTTEngine:
+    # transcribe() has no side effects, so one loaded engine serves the module
     engine = MockSTTEngine()
     engine.load_model()
-    result = engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+    return engine
+
+
+@pytest.fixture
+def fresh_mock() -> MockSTTEngine:
+    return MockSTTEngine()
+
+
+def test_mock_engine_interface(loaded_mock):
+    result = loaded_mock.transcribe(_AUDIO_16K, 16000)
     assert result == "test transcription"
-    assert engine.get_vram_usage_mb() == 100
+    assert loaded_mock.get_vram_usage_mb() == 100
 
 
-def test_mock_engine_not_loaded():
-    engine = MockSTTEngine()
+def test_mock_engine_has_no_instance_dict(fresh_mock):
+    assert not hasattr(fresh_mock, "__dict__")
+
+
+def test_mock_engine_not_loaded(fresh_mock):
     with pytest.raises(RuntimeError):
-        engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+        fresh_mock.transcribe(_AUDIO_16K, 16000)
 
 
-def test_factory_unknown_engine():
-    config = STTConfig(engine="unknown")
-    with pytest.raises(ValueError, match="Unknown STT engine"):
-        create_stt_engine(config)
+@pytest.mark.parametrize(
+    ("engine", "exc", "match"),
+    [
+        ("unknown", ValueError, "Unknown STT engine"),
+        ("sensevoice", NotImplementedError, None),
+    ],
+)
+def test_factory_errors(engine, exc, match):
+    with pytest.raises(exc, match=match):
+        create_stt_engine(STTConfig(engine=engine))
 
 
-def test_factory_sensevoice_not_implemented():
-    config = STTConfig(engine="sensevoice")
-    with pytest.raises(NotImplementedError):
-        create_stt_engine(config)
+def test_factory_creates_faster_whisper():
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    engine = create_stt_engine(STTConfig(engine="faster-whisper"))
+    assert isinstance(engine, FasterWhisperEngine)
 
 
-@patch("vox.stt.faster_whisper_engine.WhisperModel")
-def test_transcribe_passes_new_params(mock_whisper_model_cls):
+@patch("faster_whisper.vad.get_vad_model")
+@patch("faster_whisper.WhisperModel")
+def test_transcribe_passes_new_params(mock_whisper_model_cls, _mock_get_vad_model):
     """New params (hotwords, repetition_penalty, patience) are passed to transcribe()."""
     from vox.stt.faster_whisper_engine import FasterWhisperEngine
 
@@ -79,8 +109,7 @@ def test_transcribe_passes_new_params(mock_whisper_model_cls):
     engine = FasterWhisperEngine(config)
     engine.load_model()
 
-    audio = np.zeros(16000, dtype=np.float32)
-    result = engine.transcribe(audio, 16000)
+    result = engine.transcribe(_AUDIO_16K, 16000)
 
     assert result == "テスト"
     call_kwargs = mock_model.transcribe.call_args[1]
@@ -89,3 +118,87 @@ def test_transcribe_passes_new_params(mock_whisper_model_cls):
     assert call_kwargs["patience"] == 2.0
     assert call_kwargs["initial_prompt"] == "Claude Code。プログラミングに関する音声入力。"
     assert call_kwargs["beam_size"] == 5
+    assert call_kwargs["vad_filter"] is True
+    assert call_kwargs["vad_parameters"]["min_silence_duration_ms"] == 500
+
+
+def test_transcribe_kwargs_omit_noop_options():
+    """Empty prompt/hotwords and default penalty/patience are not forwarded."""
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    config = FasterWhisperConfig(initial_prompt="", hotwords=None)
+    kwargs = FasterWhisperEngine._build_transcribe_kwargs(config)
+
+    assert "initial_prompt" not in kwargs
+    assert "hotwords" not in kwargs
+    assert "repetition_penalty" not in kwargs
+    assert "patience" not in kwargs
+    assert kwargs["beam_size"] == config.beam_size
+
+
+@patch("faster_whisper.vad.get_vad_model")
+@patch("faster_whisper.WhisperModel")
+def test_load_model_preloads_vad(mock_whisper_model_cls, mock_get_vad_model):
+    """Silero VAD is initialized during load_model, not on the first transcription."""
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    engine = FasterWhisperEngine(FasterWhisperConfig())
+    engine.load_model()
+
+    mock_whisper_model_cls.assert_called_once()
+    mock_get_vad_model.assert_called_once_with()
+
+
+def test_transcribe_kwargs_without_vad_filter():
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    kwargs = FasterWhisperEngine._build_transcribe_kwargs(FasterWhisperConfig(vad_filter=False))
+
+    assert kwargs["vad_filter"] is False
+    assert "vad_parameters" not in kwargs
+
+
+@patch("faster_whisper.vad.get_vad_model")
+@patch("faster_whisper.WhisperModel")
+def test_load_model_passes_compute_type(mock_whisper_model_cls, _mock_get_vad_model):
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    FasterWhisperEngine(FasterWhisperConfig(compute_type="bfloat16")).load_model()
+
+    assert mock_whisper_model_cls.call_args[1]["compute_type"] == "bfloat16"
+
+
+@pytest.mark.parametrize(
+    ("device", "expected"),
+    [("cuda", "int8_float16"), ("cpu", "int8"), ("auto", "default")],
+)
+def test_compute_type_defaults_per_device(device, expected):
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    engine = FasterWhisperEngine(FasterWhisperConfig(device=device))
+    assert engine._compute_type == expected
+
+
+@pytest.mark.parametrize(
+    ("device", "compute_type", "expected"),
+    [
+        ("cuda", "float16", 4000),
+        ("cuda", "int8_float16", 2000),
+        ("cuda", "float32", 8000),
+        ("cpu", "int8", 0),
+    ],
+)
+def test_vram_usage_tracks_compute_type(device, compute_type, expected):
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    engine = FasterWhisperEngine(FasterWhisperConfig(device=device, compute_type=compute_type))
+    assert engine.get_vram_usage_mb() == expected
+
+
+def test_vram_usage_distil_model():
+    from vox.stt.faster_whisper_engine import FasterWhisperEngine
+
+    engine = FasterWhisperEngine(
+        FasterWhisperConfig(model="distil-large-v3", compute_type="float16")
+    )
+    assert engine.get_vram_usage_mb() == 1500